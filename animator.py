@@ -5,6 +5,10 @@ import os
 import tkinter as tk
 from tkinter import filedialog
 import zlib
+import threading
+import queue
+import hashlib
+import numpy as np
 
 DEFAULT_MONITOR_BLOCKS_X = 2
 DEFAULT_MONITOR_BLOCKS_Y = 1
@@ -29,6 +33,11 @@ CC_COLORS = {
 COLOR_NAMES = list(CC_COLORS.keys())
 COLOR_PALETTE = list(CC_COLORS.values())
 HEX_CHARS = "0123456789abcdef"
+COLOR_INDEX = {name: i for i, name in enumerate(COLOR_NAMES)}
+NAME_ARRAY = np.array(COLOR_NAMES)
+HEX_ARRAY = np.array(list(HEX_CHARS))
+BLACK = COLOR_INDEX["black"]
+MAX_UNDO = 20
 
 class AnimationEditor:
     def __init__(self):
@@ -65,6 +74,25 @@ class AnimationEditor:
         self.panning = False
         self.color_before_erase = None
 
+        self.update_queue = queue.Queue()
+        self.job_queue = queue.Queue()
+        self.active_jobs = []
+        self.job_status = ""
+        self.job_progress = 0
+        self.worker_thread = threading.Thread(target=self.job_worker, daemon=True)
+        self.worker_thread.start()
+
+        self.dirty_frames = set()
+        self.chunk_hashes = {}
+        self.export_signature = None
+
+        self.range_start = None
+        self.range_end = None
+        self.selection = None
+        self.selection_anchor = None
+        self.clipboard = None
+        self.undo_stack = []
+
         self.reinitialize_grid(set_initial_size=True)
         self.reset_animation()
 
@@ -120,9 +148,115 @@ class AnimationEditor:
 
     def reset_animation(self):
         print("Animation reset.")
-        frame = [["black" for _ in range(self.cc_width)] for _ in range(self.cc_height)]
+        frame = np.full((self.cc_height, self.cc_width), BLACK, dtype=np.uint8)
         self.animation = [frame]
         self.current_frame_index = 0
+        self.invalidate_export()
+        self.clear_selection()
+
+    def mark_dirty(self, start, end=None):
+        self.dirty_frames.update(range(start, start + 1 if end is None else end))
+
+    def invalidate_export(self):
+        self.dirty_frames = set()
+        self.chunk_hashes = {}
+        self.export_signature = None
+
+    def set_cell(self, x, y, color):
+        frame = self.animation[self.current_frame_index]
+        if frame[y, x] != COLOR_INDEX[color]:
+            frame[y, x] = COLOR_INDEX[color]
+            self.mark_dirty(self.current_frame_index)
+
+    def clear_selection(self):
+        self.range_start = self.range_end = None
+        self.selection = self.selection_anchor = None
+        self.undo_stack = []
+
+    def frame_range(self):
+        start = self.current_frame_index if self.range_start is None else self.range_start
+        end = self.current_frame_index if self.range_end is None else self.range_end
+        start, end = sorted((min(start, len(self.animation) - 1), min(end, len(self.animation) - 1)))
+        return start, end + 1
+
+    def apply_to_range(self, operation):
+        start, end = self.frame_range()
+        before = self.animation[start:end]
+        self.animation[start:end] = list(operation(np.stack(before)))
+        self.undo_stack.append((start, before))
+        del self.undo_stack[:-MAX_UNDO]
+        self.mark_dirty(start, end)
+
+    def undo(self):
+        if not self.undo_stack: return
+        start, before = self.undo_stack.pop()
+        self.animation[start:start + len(before)] = before
+        self.mark_dirty(start, start + len(before))
+
+    def flood_fill(self, x, y, color):
+        def spread_runs(region, filled):
+            starts = region.copy()
+            starts[..., 1:] &= ~region[..., :-1]
+            labels = np.cumsum(starts, axis=None).reshape(region.shape)
+            hit = np.zeros(labels[-1, -1, -1] + 1, dtype=bool)
+            hit[labels[filled]] = True
+            return hit[labels] & region
+
+        def fill(frames):
+            first_seen = {}
+            inverse = np.array([first_seen.setdefault(frame.tobytes(), len(first_seen)) for frame in frames])
+            unique = frames[np.unique(inverse, return_index=True)[1]]
+            region = unique == unique[:, y, x][:, None, None]
+            filled = np.zeros_like(region)
+            filled[:, y, x] = True
+            active = np.arange(len(unique))
+            while len(active):
+                before = np.count_nonzero(filled[active], axis=(1, 2))
+                grown = spread_runs(region[active], filled[active])
+                grown = spread_runs(region[active].transpose(0, 2, 1).copy(), grown.transpose(0, 2, 1).copy()).transpose(0, 2, 1)
+                filled[active] = grown
+                active = active[np.count_nonzero(grown, axis=(1, 2)) != before]
+            unique[filled] = COLOR_INDEX[color]
+            return unique[inverse]
+        self.apply_to_range(fill)
+
+    def remap_palette(self, mapping):
+        lut = np.arange(len(COLOR_NAMES), dtype=np.uint8)
+        for source, target in mapping.items(): lut[COLOR_INDEX[source]] = COLOR_INDEX[target]
+        self.apply_to_range(lambda frames: lut[frames])
+
+    def translate(self, dx, dy, wrap=True):
+        def shift(frames):
+            shifted = np.roll(frames, (dy, dx), axis=(1, 2))
+            if not wrap:
+                if dy > 0: shifted[:, :dy, :] = BLACK
+                elif dy < 0: shifted[:, dy:, :] = BLACK
+                if dx > 0: shifted[:, :, :dx] = BLACK
+                elif dx < 0: shifted[:, :, dx:] = BLACK
+            return shifted
+        self.apply_to_range(shift)
+
+    def copy_region(self):
+        if self.selection is None: return
+        x0, y0, x1, y1 = self.selection
+        self.clipboard = self.animation[self.current_frame_index][y0:y1 + 1, x0:x1 + 1].copy()
+
+    def paste_region(self, x, y):
+        if self.clipboard is None: return
+        height = min(self.clipboard.shape[0], self.cc_height - y)
+        width = min(self.clipboard.shape[1], self.cc_width - x)
+        if width <= 0 or height <= 0: return
+        def paste(frames):
+            frames[:, y:y + height, x:x + width] = self.clipboard[:height, :width]
+            return frames
+        self.apply_to_range(paste)
+
+    def mouse_cell(self):
+        mx, my = pygame.mouse.get_pos()
+        if mx >= self.screen.get_width() - UI_WIDTH: return None
+        world_x, world_y = self.screen_to_world(mx, my)
+        if 0 <= world_x < self.cc_width and 0 <= world_y < self.cc_height: return world_x, world_y
+        return None
 
     def run(self):
         running = True
@@ -132,11 +266,50 @@ class AnimationEditor:
                 elif event.type == pygame.VIDEORESIZE: 
                     self.screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
                 self.handle_input(event)
+            self.check_queue()
             self.handle_continuous_input()
             self.draw()
             self.clock.tick(60)
+        if self.active_jobs:
+            print("Waiting for background save/export to finish...")
+            self.job_queue.join()
         pygame.quit()
 
+    def submit_job(self, kind, key, target, *args):
+        for job in self.active_jobs:
+            if job["kind"] == kind and job["key"] == key: job["cancel"].set()
+        job = {"kind": kind, "key": key, "target": target, "args": args, "cancel": threading.Event()}
+        self.active_jobs.append(job)
+        self.job_queue.put(job)
+
+    def job_worker(self):
+        while True:
+            job = self.job_queue.get()
+            try:
+                if not job["cancel"].is_set(): job["target"](job, *job["args"])
+            except Exception as e:
+                self.update_queue.put(("status", f"Error: {e}"))
+                self.update_queue.put(("failed", job))
+                print(f"Error: {e}")
+            finally:
+                self.update_queue.put(("done", job))
+                self.job_queue.task_done()
+
+    def check_queue(self):
+        try:
+            while True:
+                message_type, value = self.update_queue.get_nowait()
+                if message_type == "progress": self.job_progress = value
+                elif message_type == "status": self.job_status = value
+                elif message_type == "failed" and value["kind"] == "export":
+                    for chunk_index in value["args"][0]: self.mark_dirty(chunk_index * self.chunk_size, (chunk_index + 1) * self.chunk_size)
+                elif message_type == "done" and value in self.active_jobs: self.active_jobs.remove(value)
+        except queue.Empty:
+            pass
+
+    def snapshot_animation(self):
+        return [frame.copy() for frame in self.animation]
+
     def handle_continuous_input(self):
         mx, my = pygame.mouse.get_pos()
         grid_width = self.screen.get_width() - UI_WIDTH
@@ -148,17 +321,26 @@ class AnimationEditor:
             self.camera_offset_x -= dx / (BASE_CELL_SIZE * self.zoom_level)
             self.camera_offset_y -= dy / (BASE_CELL_SIZE * self.zoom_level)
 
+        elif pygame.mouse.get_pressed()[0] and pygame.key.get_mods() & pygame.KMOD_SHIFT:
+            if mx < grid_width:
+                world_x, world_y = self.screen_to_world(mx, my)
+                world_x = min(max(world_x, 0), self.cc_width - 1)
+                world_y = min(max(world_y, 0), self.cc_height - 1)
+                if self.selection_anchor is None: self.selection_anchor = (world_x, world_y)
+                ax, ay = self.selection_anchor
+                self.selection = (min(ax, world_x), min(ay, world_y), max(ax, world_x), max(ay, world_y))
+
         elif pygame.mouse.get_pressed()[0]:
             if mx < grid_width:
                 world_x, world_y = self.screen_to_world(mx, my)
                 if 0 <= world_x < self.cc_width and 0 <= world_y < self.cc_height:
-                    self.animation[self.current_frame_index][world_y][world_x] = self.current_bg_color
+                    self.set_cell(world_x, world_y, self.current_bg_color)
         
         elif pygame.mouse.get_pressed()[2]:
             if mx < grid_width:
                 world_x, world_y = self.screen_to_world(mx, my)
                 if 0 <= world_x < self.cc_width and 0 <= world_y < self.cc_height:
-                    self.animation[self.current_frame_index][world_y][world_x] = "black"
+                    self.set_cell(world_x, world_y, "black")
 
     def handle_input(self, event):
         if event.type == pygame.MOUSEWHEEL:
@@ -184,12 +366,13 @@ class AnimationEditor:
                  if mx < self.screen.get_width() - UI_WIDTH:
                      world_x, world_y = self.screen_to_world(mx, my)
                      if 0 <= world_x < self.cc_width and 0 <= world_y < self.cc_height:
-                         clicked_color = self.animation[self.current_frame_index][world_y][world_x]
+                         clicked_color = COLOR_NAMES[self.animation[self.current_frame_index][world_y, world_x]]
                          if clicked_color != "black":
                              self.current_bg_color = clicked_color
         
         if event.type == pygame.MOUSEBUTTONUP:
             if event.button == 2: self.panning = False
+            elif event.button == 1: self.selection_anchor = None
 
         if event.type == pygame.KEYDOWN:
             if self.show_help and event.key != pygame.K_h:
@@ -213,29 +396,54 @@ class AnimationEditor:
                     elif self.active_input == 'chunk_size': self.chunk_size_str += event.unicode
                 return
 
+            is_ctrl_pressed = pygame.key.get_mods() & pygame.KMOD_CTRL
+            arrow_offsets = {pygame.K_LEFT: (-1, 0), pygame.K_RIGHT: (1, 0), pygame.K_UP: (0, -1), pygame.K_DOWN: (0, 1)}
+            if is_ctrl_pressed and event.key in arrow_offsets:
+                self.translate(*arrow_offsets[event.key], wrap=not pygame.key.get_mods() & pygame.KMOD_SHIFT)
+                return
+
             if event.key == pygame.K_RIGHT: self.current_frame_index = min(self.current_frame_index + 1, len(self.animation) - 1)
             elif event.key == pygame.K_LEFT: self.current_frame_index = max(self.current_frame_index - 1, 0)
             
             elif event.key == pygame.K_n:
                 is_shift_pressed = pygame.key.get_mods() & pygame.KMOD_SHIFT
-                new_frame = [row[:] for row in self.animation[self.current_frame_index]]
+                new_frame = self.animation[self.current_frame_index].copy()
                 if is_shift_pressed:
                     self.animation.insert(self.current_frame_index, new_frame)
                 else:
                     self.animation.insert(self.current_frame_index + 1, new_frame)
                     self.current_frame_index += 1
+                self.mark_dirty(self.current_frame_index, len(self.animation))
+                self.clear_selection()
 
             elif event.key == pygame.K_d:
-                if len(self.animation) > 1: self.animation.pop(self.current_frame_index); self.current_frame_index = max(0, self.current_frame_index - 1)
+                if len(self.animation) > 1:
+                    self.animation.pop(self.current_frame_index)
+                    self.mark_dirty(min(self.current_frame_index, len(self.animation) - 1), len(self.animation))
+                    self.current_frame_index = max(0, self.current_frame_index - 1)
+                    self.clear_selection()
+            elif event.key == pygame.K_LEFTBRACKET: self.range_start = self.current_frame_index
+            elif event.key == pygame.K_RIGHTBRACKET: self.range_end = self.current_frame_index
+            elif event.key == pygame.K_ESCAPE: self.range_start = self.range_end = self.selection = None
+            elif event.key == pygame.K_f:
+                cell = self.mouse_cell()
+                if cell: self.flood_fill(*cell, self.current_bg_color)
+            elif event.key == pygame.K_r and not is_ctrl_pressed:
+                cell = self.mouse_cell()
+                if cell: self.remap_palette({COLOR_NAMES[self.animation[self.current_frame_index][cell[1], cell[0]]]: self.current_bg_color})
             elif event.key == pygame.K_o and not (pygame.key.get_mods() & pygame.KMOD_CTRL): self.onion_skin_enabled = not self.onion_skin_enabled
             elif event.key == pygame.K_F11: pygame.display.toggle_fullscreen()
             elif event.key == pygame.K_h: self.show_help = not self.show_help
 
-            is_ctrl_pressed = pygame.key.get_mods() & pygame.KMOD_CTRL
             if is_ctrl_pressed:
                 if event.key == pygame.K_s: self.save_project()
                 elif event.key == pygame.K_o: self.load_project()
                 elif event.key == pygame.K_e: self.export_animation()
+                elif event.key == pygame.K_z: self.undo()
+                elif event.key == pygame.K_c: self.copy_region()
+                elif event.key == pygame.K_v:
+                    cell = self.mouse_cell()
+                    if cell: self.paste_region(*cell)
 
     def handle_ui_click(self, pos):
         ui_x = self.screen.get_width() - UI_WIDTH
@@ -273,6 +481,7 @@ class AnimationEditor:
         self.draw_frame(self.animation[self.current_frame_index], alpha=255)
         
         self.draw_grid()
+        self.draw_selection()
         self.draw_ui()
         if self.show_help: self.draw_help_overlay()
         
@@ -292,21 +501,28 @@ class AnimationEditor:
                 if x >= len(frame_data[y]): continue
                 
                 bg_color = frame_data[y][x]
-                bg_rgb = CC_COLORS[bg_color]
+                bg_rgb = COLOR_PALETTE[bg_color]
                 
                 screen_x = (x - self.camera_offset_x) * cell_size
                 screen_y = (y - self.camera_offset_y) * cell_size
                 rect = pygame.Rect(screen_x, screen_y, cell_size, cell_size)
                 
                 if alpha != 255:
-                    if bg_color != "black":
+                    if bg_color != BLACK:
                         s = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
                         s.fill((*bg_rgb, alpha))
                         self.screen.blit(s, rect.topleft)
                 else:
-                    if bg_color != "black":
+                    if bg_color != BLACK:
                         pygame.draw.rect(self.screen, bg_rgb, rect)
 
+    def draw_selection(self):
+        if self.selection is None: return
+        cell_size = BASE_CELL_SIZE * self.zoom_level
+        x0, y0, x1, y1 = self.selection
+        rect = pygame.Rect((x0 - self.camera_offset_x) * cell_size, (y0 - self.camera_offset_y) * cell_size, (x1 - x0 + 1) * cell_size, (y1 - y0 + 1) * cell_size)
+        pygame.draw.rect(self.screen, (255, 200, 0), rect, 2)
+
     def draw_grid(self):
         cell_size = BASE_CELL_SIZE * self.zoom_level
         grid_width = self.screen.get_width() - UI_WIDTH
@@ -388,8 +604,16 @@ class AnimationEditor:
         
         self.screen.blit(self.ui_font_small.render(f"Grid: {self.cc_width} x {self.cc_height}", True, "gray"), (left_margin, current_y))
         self.screen.blit(self.ui_font_small.render(f"Pixels: {self.pixels_dims}", True, "gray"), (left_margin, current_y + 15))
+        range_start, range_end = self.frame_range()
+        self.screen.blit(self.ui_font_small.render(f"Range: {range_start + 1} - {range_end}", True, "gray"), (left_margin, current_y + 30))
 
         footer_y = screen_h - 40
+        if self.job_status:
+            self.screen.blit(self.ui_font_small.render(self.job_status, True, (180, 180, 180)), (left_margin, footer_y - 50))
+        if self.active_jobs:
+            bar_rect = pygame.Rect(left_margin, footer_y - 32, UI_WIDTH - 30, 10)
+            pygame.draw.rect(self.screen, (60, 60, 60), bar_rect)
+            pygame.draw.rect(self.screen, (100, 150, 200), (bar_rect.x, bar_rect.y, bar_rect.width * min(self.job_progress, 100) / 100, bar_rect.height))
         pygame.draw.rect(self.screen, (45, 45, 45), (ui_x + 10, footer_y - 10, UI_WIDTH - 20, 40))
         pygame.draw.rect(self.screen, (80, 80, 80), (ui_x + 10, footer_y - 10, UI_WIDTH - 20, 40), 1)
         self.screen.blit(self.ui_font.render("Press 'H' for HOTKEYS", True, (255, 200, 0)), (ui_x + 40, footer_y))
@@ -400,7 +624,7 @@ class AnimationEditor:
         self.screen.blit(overlay, (0, 0))
         
         cx, cy = self.screen.get_width() // 2, self.screen.get_height() // 2
-        box_w, box_h = 500, 400
+        box_w, box_h = 500, 560
         rect = pygame.Rect(cx - box_w//2, cy - box_h//2, box_w, box_h)
         pygame.draw.rect(self.screen, (40, 40, 40), rect)
         pygame.draw.rect(self.screen, (100, 100, 100), rect, 2)
@@ -420,6 +644,14 @@ class AnimationEditor:
             ("D", "Delete Frame"),
             ("O", "Toggle Onion Skin"),
             ("", ""),
+            ("[ / ]", "Set Frame Range Start/End (Esc: Clear)"),
+            ("Shift + LMB Drag", "Select Region"),
+            ("F", "Flood Fill Range"),
+            ("R", "Recolor Range (Hovered -> Current)"),
+            ("Ctrl + Arrows", "Scroll Range (Shift: Shift In Black)"),
+            ("Ctrl + C / Ctrl + V", "Copy Region / Paste Into Range"),
+            ("Ctrl + Z", "Undo Bulk Operation"),
+            ("", ""),
             ("Ctrl + S", "Save Project"),
             ("Ctrl + O", "Open Project"),
             ("Ctrl + E", "Export for ComputerCraft"),
@@ -443,12 +675,35 @@ class AnimationEditor:
         if not filepath: return
         project_data = {
             "config": {"monitor_blocks_x": self.monitor_blocks_x, "monitor_blocks_y": self.monitor_blocks_y, "scale": self.scale, "fps": self.fps, "chunk_size": self.chunk_size},
-            "animation_data": self.animation
+            "animation_data": self.snapshot_animation()
         }
-        try:
-            with open(filepath, "w") as f: json.dump(project_data, f, indent=2)
-            print(f"Saved to {filepath}")
-        except Exception as e: print(f"Error: {e}")
+        self.submit_job("save", filepath, self.write_project, filepath, project_data)
+
+    def write_project(self, job, filepath, project_data):
+        self.update_queue.put(("progress", 0))
+        self.update_queue.put(("status", "Saving..."))
+        frames = project_data["animation_data"]
+        temp_path = filepath + ".tmp"
+        with open(temp_path, "w") as f:
+            f.write('{"config": ' + json.dumps(project_data["config"]) + ', "animation_data": [\n')
+            for i, frame in enumerate(frames):
+                if job["cancel"].is_set(): break
+                if i: f.write(",\n")
+                f.write(json.dumps(NAME_ARRAY[frame].tolist()))
+                if i % 50 == 0: self.update_queue.put(("progress", i / len(frames) * 100))
+            f.write("\n]}")
+        if job["cancel"].is_set():
+            os.remove(temp_path)
+            return
+        os.replace(temp_path, filepath)
+        self.update_queue.put(("progress", 100))
+        self.update_queue.put(("status", f"Saved {os.path.basename(filepath)}"))
+        print(f"Saved to {filepath}")
+
+    def write_atomic(self, filepath, content):
+        temp_path = filepath + ".tmp"
+        with open(temp_path, "w") as f: f.write(content)
+        os.replace(temp_path, filepath)
 
     def load_project(self):
         root = tk.Tk(); root.withdraw()
@@ -463,39 +718,77 @@ class AnimationEditor:
             self.fps_str = str(config.get("fps", 10))
             self.chunk_size_str = str(config.get("chunk_size", 100))
             self.reinitialize_grid(set_initial_size=True, force_recalc=False if "width" in config else True)
-            self.animation = project_data["animation_data"]
+            self.animation = []
+            for frame_names in project_data["animation_data"]:
+                names = np.array(frame_names)
+                frame = np.full(names.shape, BLACK, dtype=np.uint8)
+                for i, name in enumerate(COLOR_NAMES): frame[names == name] = i
+                self.animation.append(frame)
             self.current_frame_index = 0
+            self.invalidate_export()
+            self.clear_selection()
             print(f"Loaded {filepath}")
         except Exception as e: print(f"Error: {e}")
 
     def export_animation(self):
+        base_filename = "animation"
+        chunk_count = (len(self.animation) + self.chunk_size - 1) // self.chunk_size
+        signature = (self.cc_width, self.cc_height, self.chunk_size)
+        master_path = os.path.join(base_filename, f"{base_filename}.mcanim")
+        if signature != self.export_signature or not os.path.exists(master_path):
+            self.chunk_hashes = {}
+            dirty_chunks = set(range(chunk_count))
+        else:
+            dirty_chunks = {f // self.chunk_size for f in self.dirty_frames}
+            for job in self.active_jobs:
+                if job["kind"] == "export": dirty_chunks.update(job["args"][0])
+        dirty_chunks = {c for c in dirty_chunks if c < chunk_count}
+        chunks = {c: [frame.copy() for frame in self.animation[c * self.chunk_size : (c + 1) * self.chunk_size]] for c in sorted(dirty_chunks)}
+        self.dirty_frames = set()
+        self.export_signature = signature
+        self.submit_job("export", base_filename, self.write_export, chunks, chunk_count, self.chunk_hashes, self.cc_width, self.cc_height, self.fps, self.scale)
+
+    def write_export(self, job, chunks, chunk_count, chunk_hashes, cc_width, cc_height, fps, scale):
         print("Exporting...")
+        self.update_queue.put(("progress", 0))
+        self.update_queue.put(("status", "Exporting..."))
         palette_map = {HEX_CHARS[i]: name for i, name in enumerate(COLOR_NAMES)}
-        color_to_hex = {name: HEX_CHARS[i] for i, name in enumerate(COLOR_NAMES)}
         base_filename = "animation"
         output_folder = base_filename
         if not os.path.exists(output_folder): os.makedirs(output_folder)
-        chunk_filenames = []
-        for chunk_index, i in enumerate(range(0, len(self.animation), self.chunk_size)):
-            chunk_data = self.animation[i : i + self.chunk_size]
-            chunk_output_filename = f"{base_filename}_{chunk_index}.canim"
-            chunk_filenames.append(chunk_output_filename)
+        chunk_filenames = [f"{base_filename}_{chunk_index}.canim" for chunk_index in range(chunk_count)]
+        written = 0
+        for done, (chunk_index, chunk_data) in enumerate(chunks.items()):
+            if job["cancel"].is_set():
+                print("Export superseded.")
+                return
+            self.update_queue.put(("progress", done / len(chunks) * 100))
+            chunk_output_filename = chunk_filenames[chunk_index]
             chunk_frames = []
-            keyframe_bgs = "".join([color_to_hex[chunk_data[0][y][x]] for y in range(self.cc_height) for x in range(self.cc_width)])
+            keyframe_bgs = "".join(HEX_ARRAY[chunk_data[0]].ravel())
             chunk_frames.append({"type": "full", "bgs": keyframe_bgs})
             for frame_idx in range(1, len(chunk_data)):
                 prev_frame, curr_frame = chunk_data[frame_idx-1], chunk_data[frame_idx]
-                changes = []
-                for y in range(self.cc_height):
-                    for x in range(self.cc_width):
-                        if prev_frame[y][x] != curr_frame[y][x]: changes.append({"x": x + 1, "y": y + 1, "bg": color_to_hex[curr_frame[y][x]]})
+                ys, xs = np.nonzero(prev_frame != curr_frame)
+                changes = [{"x": x + 1, "y": y + 1, "bg": HEX_CHARS[curr_frame[y, x]]} for y, x in zip(ys.tolist(), xs.tolist())]
                 chunk_frames.append({"type": "delta", "changes": changes})
             chunk_json_string = json.dumps({"frames": chunk_frames}, separators=(',', ':'))
+            chunk_hash = hashlib.sha1(chunk_json_string.encode('utf-8')).hexdigest()
+            chunk_path = os.path.join(output_folder, chunk_output_filename)
+            if chunk_hashes.get(chunk_index) == chunk_hash and os.path.exists(chunk_path): continue
             compressed_data = zlib.compress(chunk_json_string.encode('utf-8'))
             base64_string = base64.b64encode(compressed_data).decode('ascii')
-            with open(os.path.join(output_folder, chunk_output_filename), "w") as f: f.write(base64_string)
-        master_output = {"header": { "width": self.cc_width, "height": self.cc_height, "fps": self.fps, "scale": self.scale, "palette": palette_map }, "chunks": chunk_filenames}
-        with open(os.path.join(output_folder, f"{base_filename}.mcanim"), "w") as f: json.dump(master_output, f, indent=2)
+            self.write_atomic(chunk_path, base64_string)
+            chunk_hashes[chunk_index] = chunk_hash
+            written += 1
+        for chunk_index in [c for c in chunk_hashes if c >= chunk_count]:
+            del chunk_hashes[chunk_index]
+            stale_path = os.path.join(output_folder, f"{base_filename}_{chunk_index}.canim")
+            if os.path.exists(stale_path): os.remove(stale_path)
+        master_output = {"header": { "width": cc_width, "height": cc_height, "fps": fps, "scale": scale, "palette": palette_map }, "chunks": chunk_filenames}
+        self.write_atomic(os.path.join(output_folder, f"{base_filename}.mcanim"), json.dumps(master_output, indent=2))
+        self.update_queue.put(("progress", 100))
+        self.update_queue.put(("status", f"Exported {written} of {chunk_count} chunks"))
         print(f"Export complete.")
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ local ok_b64, base64 = pcall(require, "base64")
 if not ok_zlib then error("Missing library: zlib_decompress.lua. Error: " .. tostring(zlib)) end
 if not ok_b64 then error("Missing library: base64.lua. Error: " .. tostring(base64)) end
 
-function player.play(master_filename, mon)
+function player.play(master_filename, mon, start_epoch)
     local master_file = fs.open(master_filename, "r")
     if not master_file then print("Master animation file not found: " .. master_filename); return end
     local master_content = master_file.readAll()
@@ -42,6 +42,17 @@ function player.play(master_filename, mon)
     local frame_buffer = {}
     for y=1, anim_height do frame_buffer[y] = {} end
 
+    local frame_number = 0
+    local sync = header.sync
+    if sync then
+        start_epoch = start_epoch or (math.floor(os.epoch("utc") / sync.interval) + 1) * sync.interval
+        print(string.format("Tile %d,%d of %dx%d: %d frames, starting at %d", sync.x, sync.y, sync.columns, sync.rows, sync.frames, start_epoch))
+    end
+    if start_epoch then
+        local wait_time = (start_epoch - os.epoch("utc")) / 1000
+        if wait_time > 0 then sleep(wait_time) end
+    end
+
     for _, chunk_filename in ipairs(master_anim.chunks) do
         print("Loading chunk: " .. chunk_filename)
 
@@ -79,19 +90,32 @@ function player.play(master_filename, mon)
                 end
             end
 
-            for y = 1, header.height do
-                mon.setCursorPos(1 + x_offset, y + y_offset)
-                for x = 1, header.width do
-                    mon.setBackgroundColor(term_colors[frame_buffer[y][x]])
-                    mon.write(" ")
+            local behind = start_epoch and os.epoch("utc") >= start_epoch + (frame_number + 1) * time_per_frame * 1000
+            if not behind then
+                for y = 1, header.height do
+                    mon.setCursorPos(1 + x_offset, y + y_offset)
+                    for x = 1, header.width do
+                        mon.setBackgroundColor(term_colors[frame_buffer[y][x]])
+                        mon.write(" ")
+                    end
                 end
             end
             
-            local sleep_time = time_per_frame - (os.clock() - start_time)
+            frame_number = frame_number + 1
+            local sleep_time
+            if start_epoch then
+                sleep_time = (start_epoch + frame_number * time_per_frame * 1000 - os.epoch("utc")) / 1000
+            else
+                sleep_time = time_per_frame - (os.clock() - start_time)
+            end
             if sleep_time > 0 then sleep(sleep_time) end
         end
     end
 
+    if sync and frame_number ~= sync.frames then
+        print(string.format("Warning: tile played %d of %d frames, wall is out of sync", frame_number, sync.frames))
+    end
+
     mon.setTextScale(original_scale)
     mon.setBackgroundColor(colors.black)
     mon.clear()
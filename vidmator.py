@@ -2,13 +2,14 @@ import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 import cv2
 import numpy as np
-from PIL import Image
 import json
 import zlib
 import base64
 import threading
 import queue
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 CC_COLORS_RGB = np.array([
     [240, 240, 240], [242, 178, 51], [229, 127, 216], [153, 178, 242],
@@ -20,21 +21,165 @@ COLOR_NAMES = [
     "white", "orange", "magenta", "lightBlue", "yellow", "lime", "pink", "gray",
     "lightGray", "cyan", "purple", "blue", "brown", "green", "red", "black"
 ]
+CC_COLORS_BGR = CC_COLORS_RGB[:, ::-1].astype(np.float32)
 HEX_CHARS = "0123456789abcdef"
+MAX_WALL_TILES = 8
+WALL_SYNC_INTERVAL_MS = 5000
+DOWNSCALE_MODES = ["Area", "Prefiltered"]
+
+def downscale_frame(frame, width, height, mode, out):
+    if mode == "Prefiltered":
+        while frame.shape[1] >= width * 2 and frame.shape[0] >= height * 2:
+            frame = cv2.pyrDown(frame)
+        resized = cv2.resize(frame, (width, height), interpolation=cv2.INTER_LANCZOS4)
+    else:
+        resized = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+    np.copyto(out, resized)
+    return out
+
+def dither_frame(dither_array):
+    height, width = dither_array.shape[:2]
+    output_indices = np.zeros((height, width), dtype=int)
+
+    for y in range(height):
+        for x in range(width):
+            old_pixel = dither_array[y, x]
+
+            distances = np.sqrt(np.sum((old_pixel - CC_COLORS_BGR)**2, axis=1))
+            closest_index = np.argmin(distances)
+            new_pixel = CC_COLORS_BGR[closest_index]
+
+            output_indices[y, x] = closest_index
+
+            quant_error = old_pixel - new_pixel
+
+            if x + 1 < width:
+                dither_array[y, x + 1] += quant_error * 7 / 16
+            if y + 1 < height:
+                if x - 1 >= 0:
+                    dither_array[y + 1, x - 1] += quant_error * 3 / 16
+                dither_array[y + 1, x] += quant_error * 5 / 16
+                if x + 1 < width:
+                    dither_array[y + 1, x + 1] += quant_error * 1 / 16
+
+    return output_indices
+
+def convert_frame(frame, width, height, mode, dither_array):
+    downscale_frame(frame, width, height, mode, dither_array)
+    cc_frame = [COLOR_NAMES[i] for i in dither_frame(dither_array).flatten()]
+    return [cc_frame[i:i+width] for i in range(0, len(cc_frame), width)]
+
+def iter_source_frames(cap, frame_skip, total_frames, start=None, count=None):
+    frame_count = start or 0
+    source_index = int(frame_count * frame_skip)
+    if start is not None:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, source_index)
+
+    first_frame = frame_count
+    while count is None or frame_count < first_frame + count:
+        pos_frames = int(frame_count * frame_skip)
+        if pos_frames >= total_frames: return
+
+        if pos_frames < source_index:
+            yield frame_count, None
+            frame_count += 1
+            continue
+
+        while source_index < pos_frames:
+            if not cap.grab(): return
+            source_index += 1
+
+        ret, frame = cap.read()
+        if not ret: return
+        source_index += 1
+
+        yield frame_count, frame
+        frame_count += 1
+
+def parse_dry_run_configs(text):
+    configs = []
+    for entry in text.replace(",", ";").split(";"):
+        entry = entry.strip()
+        if not entry: continue
+        try:
+            monitor, rest = entry.split("@")
+            scale, fps = rest.split("/")
+            mon_x, mon_y = monitor.lower().split("x")
+            configs.append((int(mon_x), int(mon_y), float(scale), int(fps)))
+        except ValueError:
+            raise ValueError(f"Bad config '{entry}', expected WxH@scale/fps (e.g. 2x1@1.0/10)")
+    return configs
+
+def encode_chunk(chunk_data, width, height):
+    color_to_hex = {name: HEX_CHARS[i] for i, name in enumerate(COLOR_NAMES)}
+    chunk_frames = []
+
+    keyframe_bgs = "".join([color_to_hex[chunk_data[0][y][x]] for y in range(height) for x in range(width)])
+    chunk_frames.append({"type": "full", "bgs": keyframe_bgs})
+
+    for frame_idx in range(1, len(chunk_data)):
+        prev_frame, curr_frame = chunk_data[frame_idx-1], chunk_data[frame_idx]
+        changes = []
+        for y in range(height):
+            for x in range(width):
+                if prev_frame[y][x] != curr_frame[y][x]:
+                    changes.append({"x": x + 1, "y": y + 1, "bg": color_to_hex[curr_frame[y][x]]})
+
+        chunk_frames.append({"type": "delta", "changes": changes})
+
+    chunk_json_string = json.dumps({"frames": chunk_frames}, separators=(',', ':'))
+    compressed_data = zlib.compress(chunk_json_string.encode('utf-8'))
+    return base64.b64encode(compressed_data).decode('ascii')
+
+def split_tile(animation, tile_x, tile_y, tile_width, tile_height):
+    x0, y0 = tile_x * tile_width, tile_y * tile_height
+    return [[row[x0:x0 + tile_width] for row in frame[y0:y0 + tile_height]] for frame in animation]
+
+def write_animation(output_folder, base_filename, animation, width, height, fps, scale, chunk_size, extra_header=None):
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+
+    palette_map = {HEX_CHARS[i]: name for i, name in enumerate(COLOR_NAMES)}
+    chunk_filenames = []
+
+    for chunk_index, i in enumerate(range(0, len(animation), chunk_size)):
+        chunk_output_filename = f"{base_filename}_{chunk_index}.canim"
+        chunk_filenames.append(chunk_output_filename)
+
+        with open(os.path.join(output_folder, chunk_output_filename), "w") as f:
+            f.write(encode_chunk(animation[i : i + chunk_size], width, height))
+
+    header = { "width": width, "height": height, "fps": fps, "scale": scale, "palette": palette_map }
+    if extra_header:
+        header.update(extra_header)
+
+    master_output = {"header": header, "chunks": chunk_filenames}
+
+    with open(os.path.join(output_folder, f"{base_filename}.mcanim"), "w") as f:
+        json.dump(master_output, f, indent=2)
+
+    return chunk_filenames
 
 class VideoConverterApp:
     def __init__(self, root):
         self.root = root
         self.root.title("CC Video to .canim Converter")
-        self.root.geometry("420x550")
+        self.root.geometry("420x690")
         self.root.resizable(False, False)
 
         self.filepath = tk.StringVar(value="No file selected")
         self.monitor_x = tk.StringVar(value="2")
         self.monitor_y = tk.StringVar(value="1")
         self.scale = tk.StringVar(value="1.0")
+        self.wall_x = tk.StringVar(value="1")
+        self.wall_y = tk.StringVar(value="1")
         self.fps = tk.StringVar(value="10")
         self.chunk_size = tk.StringVar(value="10")
+        self.downscale = tk.StringVar(value=DOWNSCALE_MODES[0])
+        self.dry_run_configs = tk.StringVar(value="")
+        self.dry_run_samples = tk.StringVar(value="4")
+        self.dry_run_frames = tk.StringVar(value="20")
+        self.dry_run_window = None
         self.status = tk.StringVar(value="Ready to convert.")
         self._filepath_full = ""
 
@@ -75,6 +220,21 @@ class VideoConverterApp:
         combo_scale['values'] = ["0.5", "1.0", "1.5"]
         combo_scale.grid(row=2, column=1, sticky=tk.E, pady=5)
 
+        wall_frame = ttk.Labelframe(main_frame, text="Video Wall (Monitors)", padding="10")
+        wall_frame.pack(fill=tk.X, pady=(0, 15))
+
+        wall_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(wall_frame, text="Columns:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        combo_wall_x = ttk.Combobox(wall_frame, textvariable=self.wall_x, state="readonly", width=10)
+        combo_wall_x['values'] = [str(i) for i in range(1, MAX_WALL_TILES + 1)]
+        combo_wall_x.grid(row=0, column=1, sticky=tk.E, pady=5)
+
+        ttk.Label(wall_frame, text="Rows:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        combo_wall_y = ttk.Combobox(wall_frame, textvariable=self.wall_y, state="readonly", width=10)
+        combo_wall_y['values'] = [str(i) for i in range(1, MAX_WALL_TILES + 1)]
+        combo_wall_y.grid(row=1, column=1, sticky=tk.E, pady=5)
+
         anim_frame = ttk.Labelframe(main_frame, text="Animation Settings", padding="10")
         anim_frame.pack(fill=tk.X, pady=(0, 15))
         
@@ -89,8 +249,19 @@ class VideoConverterApp:
         entry_chunk = ttk.Entry(anim_frame, textvariable=self.chunk_size, width=13)
         entry_chunk.grid(row=1, column=1, sticky=tk.E, pady=5)
 
-        self.convert_button = ttk.Button(main_frame, text="START CONVERSION", command=self.start_conversion)
-        self.convert_button.pack(fill=tk.X, pady=(10, 10), ipady=5)
+        ttk.Label(anim_frame, text="Downscale:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        combo_downscale = ttk.Combobox(anim_frame, textvariable=self.downscale, state="readonly", width=10)
+        combo_downscale['values'] = DOWNSCALE_MODES
+        combo_downscale.grid(row=2, column=1, sticky=tk.E, pady=5)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 10))
+
+        self.dry_run_button = ttk.Button(button_frame, text="DRY RUN...", command=self.open_dry_run_settings)
+        self.dry_run_button.pack(side=tk.LEFT, padx=(0, 10), ipady=5)
+
+        self.convert_button = ttk.Button(button_frame, text="START CONVERSION", command=self.start_conversion)
+        self.convert_button.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=5)
 
         self.progress = ttk.Progressbar(main_frame, orient=tk.HORIZONTAL, mode='determinate')
         self.progress.pack(fill=tk.X, pady=(0, 10))
@@ -98,6 +269,35 @@ class VideoConverterApp:
         self.lbl_status = ttk.Label(main_frame, textvariable=self.status, anchor="center", font=("Arial", 9))
         self.lbl_status.pack(fill=tk.X)
 
+    def open_dry_run_settings(self):
+        if self.dry_run_window is not None and self.dry_run_window.winfo_exists():
+            self.dry_run_window.lift()
+            return
+
+        self.dry_run_window = tk.Toplevel(self.root)
+        self.dry_run_window.title("Dry Run Estimate")
+        self.dry_run_window.resizable(False, False)
+
+        dry_frame = ttk.Frame(self.dry_run_window, padding="15")
+        dry_frame.pack(fill=tk.BOTH, expand=True)
+
+        dry_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(dry_frame, text="Configs (WxH@scale/fps; ...):").grid(row=0, column=0, sticky=tk.W, pady=5)
+        entry_configs = ttk.Entry(dry_frame, textvariable=self.dry_run_configs, width=20)
+        entry_configs.grid(row=0, column=1, sticky=tk.E, pady=5)
+
+        ttk.Label(dry_frame, text="Sampled Segments:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        entry_samples = ttk.Entry(dry_frame, textvariable=self.dry_run_samples, width=13)
+        entry_samples.grid(row=1, column=1, sticky=tk.E, pady=5)
+
+        ttk.Label(dry_frame, text="Frames per Segment:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        entry_segment = ttk.Entry(dry_frame, textvariable=self.dry_run_frames, width=13)
+        entry_segment.grid(row=2, column=1, sticky=tk.E, pady=5)
+
+        btn_run = ttk.Button(dry_frame, text="RUN ESTIMATE", command=self.start_dry_run)
+        btn_run.grid(row=3, column=0, columnspan=2, sticky=tk.EW, pady=(10, 0), ipady=5)
+
     def select_file(self):
         path = filedialog.askopenfilename(filetypes=[("MP4 files", "*.mp4"), ("All files", "*.*")])
         if path:
@@ -112,6 +312,7 @@ class VideoConverterApp:
             return
             
         self.convert_button.config(state="disabled")
+        self.dry_run_button.config(state="disabled")
         self.status.set("Initializing...")
         self.progress['value'] = 0
 
@@ -120,7 +321,42 @@ class VideoConverterApp:
         
         self.root.after(100, self.check_queue)
 
+    def start_dry_run(self):
+        if not self._filepath_full:
+            messagebox.showwarning("Warning", "Please select a video file first.")
+            return
+
+        try:
+            configs = parse_dry_run_configs(self.dry_run_configs.get())
+        except ValueError as e:
+            messagebox.showwarning("Warning", str(e))
+            return
+        if not configs:
+            configs = [(int(self.monitor_x.get()), int(self.monitor_y.get()), float(self.scale.get()), int(self.fps.get()))]
+
+        self.dry_run_window.destroy()
+
+        self.convert_button.config(state="disabled")
+        self.dry_run_button.config(state="disabled")
+        self.status.set("Sampling...")
+        self.progress['value'] = 0
+
+        self.conversion_thread = threading.Thread(target=self.dry_run, args=(configs,), daemon=True)
+        self.conversion_thread.start()
+
+        self.root.after(100, self.check_queue)
+
     def check_queue(self):
+        self.drain_queue()
+
+        if self.conversion_thread.is_alive():
+            self.root.after(100, self.check_queue)
+        else:
+            self.drain_queue()
+            self.convert_button.config(state="normal")
+            self.dry_run_button.config(state="normal")
+
+    def drain_queue(self):
         try:
             while True:
                 message_type, value = self.update_queue.get_nowait()
@@ -128,24 +364,24 @@ class VideoConverterApp:
                     self.progress['value'] = value
                 elif message_type == "status":
                     self.status.set(value)
+                elif message_type == "dry_run":
+                    self.show_dry_run_results(value)
         except queue.Empty:
             pass
 
-        if self.conversion_thread.is_alive():
-            self.root.after(100, self.check_queue)
-        else:
-            self.convert_button.config(state="normal")
-
     def convert_video(self):
         try:
             vid_path = self._filepath_full
             mon_x, mon_y = int(self.monitor_x.get()), int(self.monitor_y.get())
             scale, fps = float(self.scale.get()), int(self.fps.get())
             chunk_size = max(1, int(self.chunk_size.get()))
+            wall_x, wall_y = int(self.wall_x.get()), int(self.wall_y.get())
+            downscale_mode = self.downscale.get()
 
-            cc_width = round((64 * mon_x - 20) / (6 * scale))
-            cc_height = round((64 * mon_y - 20) / (9 * scale))
-            self.update_queue.put(("status", f"Grid: {cc_width}x{cc_height} chars | FPS: {fps}"))
+            tile_width = round((64 * mon_x - 20) / (6 * scale))
+            tile_height = round((64 * mon_y - 20) / (9 * scale))
+            cc_width, cc_height = tile_width * wall_x, tile_height * wall_y
+            self.update_queue.put(("status", f"Grid: {cc_width}x{cc_height} chars | Tiles: {wall_x}x{wall_y} | FPS: {fps}"))
 
             cap = cv2.VideoCapture(vid_path)
             source_fps = cap.get(cv2.CAP_PROP_FPS)
@@ -153,58 +389,26 @@ class VideoConverterApp:
             frame_skip = source_fps / fps if fps > 0 else source_fps
 
             processed_frames = []
-            frame_count = 0
+            dither_array = np.empty((cc_height, cc_width, 3), dtype=np.float32)
             
-            while True:
-                pos_frames = int(frame_count * frame_skip)
-                if pos_frames >= total_frames: break
-                
-                cap.set(cv2.CAP_PROP_POS_FRAMES, pos_frames)
-                ret, frame = cap.read()
-                if not ret: break
+            for frame_count, frame in iter_source_frames(cap, frame_skip, total_frames):
+                if frame is None:
+                    processed_frames.append(processed_frames[-1])
+                    continue
 
                 if frame_count % 5 == 0:
                     self.update_queue.put(("status", f"Processing frame {len(processed_frames)+1}..."))
                     self.update_queue.put(("progress", (frame_count / (total_frames / frame_skip)) * 100))
 
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                pil_img = Image.fromarray(frame_rgb)
-                resized_img = pil_img.resize((cc_width, cc_height), Image.Resampling.LANCZOS)
-                
-                dither_array = np.array(resized_img, dtype=float)
-                output_indices = np.zeros((cc_height, cc_width), dtype=int)
-
-                for y in range(cc_height):
-                    for x in range(cc_width):
-                        old_pixel = dither_array[y, x]
-                        
-                        distances = np.sqrt(np.sum((old_pixel - CC_COLORS_RGB)**2, axis=1))
-                        closest_index = np.argmin(distances)
-                        new_pixel = CC_COLORS_RGB[closest_index]
-                        
-                        output_indices[y, x] = closest_index
-                        
-                        quant_error = old_pixel - new_pixel
-                        
-                        if x + 1 < cc_width:
-                            dither_array[y, x + 1] += quant_error * 7 / 16
-                        if y + 1 < cc_height:
-                            if x - 1 >= 0:
-                                dither_array[y + 1, x - 1] += quant_error * 3 / 16
-                            dither_array[y + 1, x] += quant_error * 5 / 16
-                            if x + 1 < cc_width:
-                                dither_array[y + 1, x + 1] += quant_error * 1 / 16
-
-                cc_frame_indices = output_indices.flatten()
-                cc_frame = [COLOR_NAMES[i] for i in cc_frame_indices]
-                
-                processed_frames.append([cc_frame[i:i+cc_width] for i in range(0, len(cc_frame), cc_width)])
-                frame_count += 1
+                processed_frames.append(convert_frame(frame, cc_width, cc_height, downscale_mode, dither_array))
             
             cap.release()
 
             self.update_queue.put(("status", "Exporting to .canim format..."))
-            self.export_animation(processed_frames, cc_width, cc_height, fps, scale, chunk_size)
+            if wall_x * wall_y > 1:
+                self.export_tiled_animation(processed_frames, tile_width, tile_height, wall_x, wall_y, fps, scale, chunk_size)
+            else:
+                self.export_animation(processed_frames, cc_width, cc_height, fps, scale, chunk_size)
             
         except Exception as e:
             self.update_queue.put(("status", f"Error: {e}"))
@@ -213,56 +417,150 @@ class VideoConverterApp:
             self.update_queue.put(("progress", 100))
             self.convert_button.config(state="normal")
 
+    def dry_run(self, configs):
+        try:
+            vid_path = self._filepath_full
+            samples = max(1, int(self.dry_run_samples.get()))
+            segment_frames = max(1, int(self.dry_run_frames.get()))
+            chunk_size = max(1, int(self.chunk_size.get()))
+            wall_x, wall_y = int(self.wall_x.get()), int(self.wall_y.get())
+            downscale_mode = self.downscale.get()
+
+            cap = cv2.VideoCapture(vid_path)
+            source_fps = cap.get(cv2.CAP_PROP_FPS)
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+            results = []
+            for config_index, (mon_x, mon_y, scale, fps) in enumerate(configs):
+                label = f"{mon_x}x{mon_y}@{scale}/{fps}"
+                self.update_queue.put(("status", f"Sampling {label}..."))
+
+                tile_width = round((64 * mon_x - 20) / (6 * scale))
+                tile_height = round((64 * mon_y - 20) / (9 * scale))
+                cc_width, cc_height = tile_width * wall_x, tile_height * wall_y
+                frame_skip = source_fps / fps if fps > 0 else source_fps
+                output_frames = int(np.ceil(total_frames / frame_skip))
+                dither_array = np.empty((cc_height, cc_width, 3), dtype=np.float32)
+
+                sampled_frames, sampled_segments, changed_cells, delta_frames = 0, 0, 0, 0
+                keyframe_bytes, delta_bytes = 0, 0
+                start_time = time.perf_counter()
+
+                for sample in range(samples):
+                    start = int((sample + 0.5) * output_frames / samples - segment_frames / 2)
+                    start = max(0, min(output_frames - segment_frames, start))
+
+                    segment = []
+                    for frame_count, frame in iter_source_frames(cap, frame_skip, total_frames, start, segment_frames):
+                        segment.append(segment[-1] if frame is None else convert_frame(frame, cc_width, cc_height, downscale_mode, dither_array))
+                    if not segment: continue
+
+                    for tile_y in range(wall_y):
+                        for tile_x in range(wall_x):
+                            tile_segment = split_tile(segment, tile_x, tile_y, tile_width, tile_height)
+                            segment_keyframe_bytes = len(encode_chunk(tile_segment[:1], tile_width, tile_height))
+                            keyframe_bytes += segment_keyframe_bytes
+                            delta_bytes += len(encode_chunk(tile_segment, tile_width, tile_height)) - segment_keyframe_bytes
+                    sampled_segments += 1
+
+                    segment_array = np.array(segment)
+                    changed_cells += np.count_nonzero(segment_array[1:] != segment_array[:-1])
+                    delta_frames += len(segment) - 1
+                    sampled_frames += len(segment)
+
+                    self.update_queue.put(("progress", (config_index + (sample + 1) / samples) / len(configs) * 100))
+
+                if not sampled_frames: continue
+                elapsed = time.perf_counter() - start_time
+                keyframes = int(np.ceil(output_frames / chunk_size))
+                estimated_bytes = keyframe_bytes / sampled_segments * keyframes
+                if delta_frames:
+                    estimated_bytes += delta_bytes / delta_frames * (output_frames - keyframes)
+
+                results.append({
+                    "config": label,
+                    "grid": f"{tile_width}x{tile_height}",
+                    "frames": output_frames,
+                    "bytes": estimated_bytes,
+                    "changed": changed_cells / (delta_frames * wall_x * wall_y) if delta_frames else 0,
+                    "seconds": elapsed / sampled_frames * output_frames,
+                    "redraw": tile_width * tile_height * fps
+                })
+
+            cap.release()
+            self.update_queue.put(("dry_run", results))
+            self.update_queue.put(("status", f"Dry run done ({len(results)} configs)"))
+
+        except Exception as e:
+            self.update_queue.put(("status", f"Error: {e}"))
+            print(e)
+        finally:
+            self.update_queue.put(("progress", 100))
+
+    def show_dry_run_results(self, results):
+        window = tk.Toplevel(self.root)
+        window.title("Dry Run Estimate")
+
+        columns = [("config", "Config", 110), ("grid", "Monitor Grid", 85), ("frames", "Frames", 60), ("size", "Est. Size", 80),
+                   ("changed", "Changed/Monitor", 105), ("time", "Est. Convert", 90), ("redraw", "Redraw Cells/s", 100)]
+        tree = ttk.Treeview(window, columns=[c[0] for c in columns], show="headings", height=max(1, len(results)))
+        for key, heading, width in columns:
+            tree.heading(key, text=heading)
+            tree.column(key, width=width, anchor="center")
+
+        for result in results:
+            size = result["bytes"] / 1024
+            size_text = f"{size / 1024:.1f} MB" if size >= 1024 else f"{size:.0f} KB"
+            minutes, seconds = divmod(int(result["seconds"]), 60)
+            tree.insert("", tk.END, values=(result["config"], result["grid"], result["frames"], size_text,
+                                            f"{result['changed']:.0f}", f"{minutes}m {seconds:02d}s", result["redraw"]))
+
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
     def export_animation(self, animation, width, height, fps, scale, chunk_size):
-        CHUNK_SIZE = chunk_size 
+        base_filename = "animation"
+        output_folder = base_filename
+
+        self.update_queue.put(("status", "Generating chunks..."))
+        write_animation(output_folder, base_filename, animation, width, height, fps, scale, chunk_size)
+
+        self.update_queue.put(("status", f"Done! Check folder '{output_folder}'"))
+
+    def export_tiled_animation(self, animation, tile_width, tile_height, wall_x, wall_y, fps, scale, chunk_size):
         base_filename = "animation"
         output_folder = base_filename
 
         if not os.path.exists(output_folder):
             os.makedirs(output_folder)
-        
-        self.update_queue.put(("status", "Generating chunks..."))
-        
-        palette_map = {HEX_CHARS[i]: name for i, name in enumerate(COLOR_NAMES)}
-        color_to_hex = {name: HEX_CHARS[i] for i, name in enumerate(COLOR_NAMES)}
-        
-        chunk_filenames = []
-        
-        for chunk_index, i in enumerate(range(0, len(animation), CHUNK_SIZE)):
-            chunk_data = animation[i : i + CHUNK_SIZE]
-            chunk_output_filename = f"{base_filename}_{chunk_index}.canim"
-            chunk_filenames.append(chunk_output_filename)
-            
-            chunk_frames = []
-            
-            keyframe_bgs = "".join([color_to_hex[chunk_data[0][y][x]] for y in range(height) for x in range(width)])
-            chunk_frames.append({"type": "full", "bgs": keyframe_bgs})
-
-            for frame_idx in range(1, len(chunk_data)):
-                prev_frame, curr_frame = chunk_data[frame_idx-1], chunk_data[frame_idx]
-                changes = []
-                for y in range(height):
-                    for x in range(width):
-                        if prev_frame[y][x] != curr_frame[y][x]:
-                            changes.append({"x": x + 1, "y": y + 1, "bg": color_to_hex[curr_frame[y][x]]})
-                
-                chunk_frames.append({"type": "delta", "changes": changes})
-
-            chunk_json_string = json.dumps({"frames": chunk_frames}, separators=(',', ':'))
-            compressed_data = zlib.compress(chunk_json_string.encode('utf-8'))
-            base64_string = base64.b64encode(compressed_data).decode('ascii')
-            
-            with open(os.path.join(output_folder, chunk_output_filename), "w") as f:
-                f.write(base64_string)
 
-        master_output = {
-            "header": { "width": width, "height": height, "fps": fps, "scale": scale, "palette": palette_map },
-            "chunks": chunk_filenames
+        self.update_queue.put(("status", f"Generating chunks for {wall_x * wall_y} tiles..."))
+
+        tiles = []
+        with ProcessPoolExecutor() as executor:
+            futures = []
+            for tile_y in range(wall_y):
+                for tile_x in range(wall_x):
+                    tile_frames = split_tile(animation, tile_x, tile_y, tile_width, tile_height)
+                    tile_folder = f"tile_{tile_x + 1}_{tile_y + 1}"
+                    tile_header = {"sync": {"x": tile_x + 1, "y": tile_y + 1, "columns": wall_x, "rows": wall_y,
+                                            "frames": len(animation), "interval": WALL_SYNC_INTERVAL_MS}}
+                    futures.append(executor.submit(write_animation, os.path.join(output_folder, tile_folder), base_filename,
+                                                   tile_frames, tile_width, tile_height, fps, scale, chunk_size, tile_header))
+                    tiles.append({"x": tile_x + 1, "y": tile_y + 1, "master": f"{tile_folder}/{base_filename}.mcanim"})
+
+            for done, future in enumerate(futures, 1):
+                future.result()
+                self.update_queue.put(("status", f"Encoded tile {done}/{len(futures)}"))
+
+        wall_output = {
+            "header": { "width": tile_width * wall_x, "height": tile_height * wall_y, "fps": fps, "scale": scale,
+                        "frames": len(animation), "columns": wall_x, "rows": wall_y },
+            "tiles": tiles
         }
-        
-        with open(os.path.join(output_folder, f"{base_filename}.mcanim"), "w") as f:
-            json.dump(master_output, f, indent=2)
-            
+
+        with open(os.path.join(output_folder, f"{base_filename}.wall"), "w") as f:
+            json.dump(wall_output, f, indent=2)
+
         self.update_queue.put(("status", f"Done! Check folder '{output_folder}'"))
 
 if __name__ == "__main__":